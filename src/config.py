@@ -23,7 +23,14 @@ DEFAULT_CONFIG = {
 class Config:
     def __init__(self):
         self.config_file = Path("config.json")
-        self.config = self.load_config()
+        self._config = None
+
+    @property
+    def config(self):
+        # Read config.json on first access, not at construction
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
 
     def load_config(self):
         if self.config_file.exists():
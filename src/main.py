@@ -5,20 +5,26 @@ A simple command-line tool to track workouts, nutrition, and progress.
 """
 
 import argparse
-import sys
-import json
-from datetime import datetime
-from .models import WorkoutEntry, WeightEntry
-from .storage import DataStorage
-from .utils import parse_workout_type, validate_positive_number
+
+# Keep module scope down to argparse: every handler imports its own
+# dependencies so a command only pays for what it actually uses. Heavy
+# modules (analytics, pandas, matplotlib) must never be imported here.
+
+def _get_storage():
+    from .storage import DataStorage
+    return DataStorage()
 
 def handle_workout(args):
+    from datetime import datetime
+    from .models import WorkoutEntry
+    from .utils import parse_workout_type, validate_positive_number
+
     if args.duration and not validate_positive_number(args.duration, "duration"):
         return
     if args.calories and not validate_positive_number(args.calories, "calories"):
         return
 
-    storage = DataStorage()
+    storage = _get_storage()
     profile = storage.load_profile()
 
     exercise_type = parse_workout_type(args.type)
@@ -41,10 +47,14 @@ def handle_workout(args):
         print("Error saving workout data")
 
 def handle_weight(args):
+    from datetime import datetime
+    from .models import WeightEntry
+    from .utils import validate_positive_number
+
     if not validate_positive_number(args.value, "weight"):
         return
 
-    storage = DataStorage()
+    storage = _get_storage()
     profile = storage.load_profile()
 
     weight_entry = WeightEntry(
@@ -70,7 +80,7 @@ def handle_weight(args):
 def handle_stats(args):
     from .analytics import FitnessAnalytics
 
-    storage = DataStorage()
+    storage = _get_storage()
     profile = storage.load_profile()
     analytics = FitnessAnalytics(profile)
 
@@ -117,7 +127,7 @@ def handle_stats(args):
             print(f"• {insight}")
 
 def handle_list(args):
-    storage = DataStorage()
+    storage = _get_storage()
     profile = storage.load_profile()
 
     recent_workouts = profile.get_recent_workouts(args.days)
@@ -140,7 +150,9 @@ def handle_list(args):
             print(f"  Notes: {workout.notes}")
 
 def handle_export(args):
-    storage = DataStorage()
+    import json
+
+    storage = _get_storage()
     profile = storage.load_profile()
 
     if args.format == 'json':
@@ -177,6 +189,15 @@ def handle_export(args):
     else:
         print(output)
 
+# Subcommand name -> handler
+COMMANDS = {
+    'workout': handle_workout,
+    'weight': handle_weight,
+    'stats': handle_stats,
+    'list': handle_list,
+    'export': handle_export,
+}
+
 def main():
     parser = argparse.ArgumentParser(description='Personal Fitness Logger')
     parser.add_argument('--version', action='version', version='FitnessLogger 0.2.0')
@@ -214,16 +235,7 @@ def main():
         parser.print_help()
         return
 
-    if args.command == 'workout':
-        handle_workout(args)
-    elif args.command == 'weight':
-        handle_weight(args)
-    elif args.command == 'stats':
-        handle_stats(args)
-    elif args.command == 'list':
-        handle_list(args)
-    elif args.command == 'export':
-        handle_export(args)
+    COMMANDS[args.command](args)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
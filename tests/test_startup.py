@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import budget (microseconds) for the first-party modules that
+# `fitness-logger workout` loads; generous enough to absorb slow CI machines.
+WORKOUT_IMPORT_BUDGET_US = 150000
+
+# Modules that must never be loaded just to log a workout
+HEAVY_MODULES = ('pandas', 'matplotlib', 'src.analytics')
+
+def run_with_importtime(argv, cwd):
+    code = (
+        "import sys; sys.argv = ['fitness-logger'] + %r; "
+        "from src.main import main; main()" % (argv,)
+    )
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    return result
+
+def parse_importtime(stderr):
+    # Lines look like: "import time:  self [us] | cumulative | name"
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        timings[name] = int(fields[1])
+    return timings
+
+class TestStartup(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_workout_import_budget(self):
+        result = run_with_importtime(
+            ['workout', '--type', 'run', '--duration', '30'], self.tmpdir.name
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Workout logged: Running", result.stdout)
+
+        timings = parse_importtime(result.stderr)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, timings)
+
+        first_party = sum(t for name, t in timings.items()
+                          if name == 'src' or name.startswith('src.'))
+        self.assertLess(first_party, WORKOUT_IMPORT_BUDGET_US)
+
+    def test_main_module_imports_lazily(self):
+        result = run_with_importtime(['--help'], self.tmpdir.name)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        timings = parse_importtime(result.stderr)
+        self.assertIn('src.main', timings)
+        for module in ('src.models', 'src.storage', 'src.utils', 'src.analytics'):
+            self.assertNotIn(module, timings)
+
+if __name__ == '__main__':
+    unittest.main()